@@ -1,11 +1,12 @@
-import json
-from pathlib import Path
+import os
+
+import msgspec
 
 from grubicy import get_parent, open_job_from_directory, parent_path
 from grubicy.helpers import parent_product_exists
 
 
-def main(directory: str):
+def process(directory: str) -> None:
     job = open_job_from_directory(directory)
 
     assert job.sp["action"] == "s2"
@@ -15,22 +16,25 @@ def main(directory: str):
     if not parent_product_exists(job, "s1/out.json"):
         return
     parent_out = parent_path(job) / "s1/out.json"
-    with open(parent_out, "r", encoding="utf-8") as f:
-        s1 = json.load(f)
+    with open(parent_out, "rb") as f:
+        s1 = msgspec.json.decode(f.read())
 
     value2 = s1["value"] + p2
 
-    out_path = Path(job.fn("s2/out.json"))
-    out_path.parent.mkdir(parents=True, exist_ok=True)
-    out_path.write_text(
-        json.dumps({"p1": s1["p1"], "p2": p2, "value2": value2}), encoding="utf-8"
-    )
+    out_path = job.fn("s2/out.json")
+    os.makedirs(os.path.dirname(out_path), exist_ok=True)
+    with open(out_path, "wb") as f:
+        f.write(msgspec.json.encode({"p1": s1["p1"], "p2": p2, "value2": value2}))
+
+    job.doc.update({"s2_value2": value2, "parent_s1_id": parent.id})
+
 
-    job.doc["s2_value2"] = value2
-    job.doc["parent_s1_id"] = parent.id
+def main(directories: list[str]) -> None:
+    for directory in directories:
+        process(directory)
 
 
 if __name__ == "__main__":
     import sys
 
-    main(sys.argv[1])
+    main(sys.argv[1:])
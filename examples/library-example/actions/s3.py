@@ -1,33 +1,41 @@
-import json
-from pathlib import Path
+import os
 
+import msgspec
 import signac
+
 from grubicy import get_parent
 
 
-def main(directory: str):
-    project = signac.get_project()
-    job = project.open_job(id=Path(directory).name)
+def process(project: signac.Project, directory: str) -> None:
+    job = project.open_job(id=os.path.basename(directory))
 
     assert job.sp["action"] == "s3"
     p3 = job.sp["p3"]
 
     parent = get_parent(job)
-    with open(Path(parent.fn("s2/out.json")), "r", encoding="utf-8") as f:
-        s2 = json.load(f)
+    with open(parent.fn("s2/out.json"), "rb") as f:
+        s2 = msgspec.json.decode(f.read())
 
     value3 = s2["value2"] * p3
 
-    out_path = Path(job.fn("s3/out.json"))
-    out_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(out_path, "w", encoding="utf-8") as f:
-        json.dump({"p1": s2["p1"], "p2": s2["p2"], "p3": p3, "value3": value3}, f)
+    out_path = job.fn("s3/out.json")
+    os.makedirs(os.path.dirname(out_path), exist_ok=True)
+    data = msgspec.json.encode(
+        {"p1": s2["p1"], "p2": s2["p2"], "p3": p3, "value3": value3}
+    )
+    with open(out_path, "wb") as f:
+        f.write(data)
+
+    job.doc.update({"s3_value3": value3, "parent_s2_id": parent.id})
 
-    job.doc["s3_value3"] = value3
-    job.doc["parent_s2_id"] = parent.id
+
+def main(directories: list[str]) -> None:
+    project = signac.get_project()
+    for directory in directories:
+        process(project, directory)
 
 
 if __name__ == "__main__":
     import sys
 
-    main(sys.argv[1])
+    main(sys.argv[1:])
@@ -1,15 +1,16 @@
-import json
 from pathlib import Path
 
+import msgspec
 import pandas as pd
 import signac
+
 from grubicy import get_parent
 
 
 def read_json(path: Path) -> dict:
     if not path.exists():
         return {}
-    return json.loads(path.read_text())
+    return msgspec.json.decode(path.read_bytes())
 
 
 def main():
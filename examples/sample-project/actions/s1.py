@@ -1,27 +1,33 @@
-import json
-from pathlib import Path
+import os
 
+import msgspec
 import signac
 
 
-def main(directory: str):
-    project = signac.get_project()
-    job = project.open_job(id=Path(directory).name)
+def process(project: signac.Project, directory: str) -> None:
+    job = project.open_job(id=os.path.basename(directory))
 
     assert job.sp["subproject"] == "s1"
     p1 = job.sp["p1"]
 
     value = p1 * p1
 
-    out_path = Path(job.fn("s1/out.json"))
-    out_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(out_path, "w") as f:
-        json.dump({"p1": p1, "value": value}, f)
+    out_path = job.fn("s1/out.json")
+    os.makedirs(os.path.dirname(out_path), exist_ok=True)
+    data = msgspec.json.encode({"p1": p1, "value": value})
+    with open(out_path, "wb") as f:
+        f.write(data)
 
     job.doc["s1_value"] = value
 
 
+def main(directories: list[str]) -> None:
+    project = signac.get_project()
+    for directory in directories:
+        process(project, directory)
+
+
 if __name__ == "__main__":
     import sys
 
-    main(sys.argv[1])
+    main(sys.argv[1:])
@@ -1,12 +1,11 @@
-import json
-from pathlib import Path
+import os
 
+import msgspec
 import signac
 
 
-def main(directory: str):
-    project = signac.get_project()
-    job = project.open_job(id=Path(directory).name)
+def process(project: signac.Project, directory: str) -> None:
+    job = project.open_job(id=os.path.basename(directory))
 
     assert job.sp["subproject"] == "s2"
     p2 = job.sp["p2"]
@@ -14,22 +13,28 @@ def main(directory: str):
 
     parent = project.open_job(parent_sp)
 
-    input_path = Path(parent.fn("s1/out.json"))
-    with open(input_path, "r") as f:
-        s1 = json.load(f)
+    input_path = parent.fn("s1/out.json")
+    with open(input_path, "rb") as f:
+        s1 = msgspec.json.decode(f.read())
 
     value2 = s1["value"] + p2
 
-    output_path = Path(job.fn("s2/out.json"))
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, "w") as f:
-        json.dump({"p1": s1["p1"], "p2": p2, "value2": value2}, f)
+    output_path = job.fn("s2/out.json")
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    data = msgspec.json.encode({"p1": s1["p1"], "p2": p2, "value2": value2})
+    with open(output_path, "wb") as f:
+        f.write(data)
+
+    job.doc.update({"s2_value2": value2, "parent_s1_id": parent.id})
 
-    job.doc["s2_value2"] = value2
-    job.doc["parent_s1_id"] = parent.id
+
+def main(directories: list[str]) -> None:
+    project = signac.get_project()
+    for directory in directories:
+        process(project, directory)
 
 
 if __name__ == "__main__":
     import sys
 
-    main(sys.argv[1])
+    main(sys.argv[1:])
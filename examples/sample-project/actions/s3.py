@@ -1,12 +1,11 @@
-import json
-from pathlib import Path
+import os
 
+import msgspec
 import signac
 
 
-def main(directory: str):
-    project = signac.get_project()
-    job = project.open_job(id=Path(directory).name)
+def process(project: signac.Project, directory: str) -> None:
+    job = project.open_job(id=os.path.basename(directory))
 
     assert job.sp["subproject"] == "s3"
     p3 = job.sp["p3"]
@@ -14,22 +13,30 @@ def main(directory: str):
 
     parent = project.open_job(parent_sp)
 
-    input_path = Path(parent.fn("s2/out.json"))
-    with open(input_path, "r") as f:
-        s2 = json.load(f)
+    input_path = parent.fn("s2/out.json")
+    with open(input_path, "rb") as f:
+        s2 = msgspec.json.decode(f.read())
 
     value3 = s2["value2"] * p3
 
-    output_path = Path(job.fn("s3/out.json"))
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, "w") as f:
-        json.dump({"p1": s2["p1"], "p2": s2["p2"], "p3": p3, "value3": value3}, f)
+    output_path = job.fn("s3/out.json")
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    data = msgspec.json.encode(
+        {"p1": s2["p1"], "p2": s2["p2"], "p3": p3, "value3": value3}
+    )
+    with open(output_path, "wb") as f:
+        f.write(data)
+
+    job.doc.update({"s3_value3": value3, "parent_s2_id": parent.id})
 
-    job.doc["s3_value3"] = value3
-    job.doc["parent_s2_id"] = parent.id
+
+def main(directories: list[str]) -> None:
+    project = signac.get_project()
+    for directory in directories:
+        process(project, directory)
 
 
 if __name__ == "__main__":
     import sys
 
-    main(sys.argv[1])
+    main(sys.argv[1:])
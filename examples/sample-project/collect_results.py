@@ -1,6 +1,6 @@
-import json
 from pathlib import Path
 
+import msgspec
 import pandas as pd
 import signac
 
@@ -8,13 +8,26 @@ import signac
 def read_json(path: Path) -> dict:
     if not path.exists():
         return {}
-    return json.loads(path.read_text())
+    return msgspec.json.decode(path.read_bytes())
 
 
 def main():
     project = signac.get_project()
 
-    rows = []
+    # One pass over the jobs, appending straight into per-column lists so
+    # pandas builds typed columns directly instead of re-inferring dtypes
+    # from a list of per-row dicts.
+    columns: dict[str, list] = {
+        "s1_job_id": [],
+        "s2_job_id": [],
+        "s3_job_id": [],
+        "p1": [],
+        "p2": [],
+        "p3": [],
+        "s1_value": [],
+        "s2_value2": [],
+        "s3_value3": [],
+    }
     for j3 in project.find_jobs({"subproject": "s3"}):
         s2_sp = j3.sp["parent_s2"]
         j2 = project.open_job(s2_sp)
@@ -26,26 +39,22 @@ def main():
         s2_out = read_json(Path(j2.fn("s2/out.json")))
         s3_out = read_json(Path(j3.fn("s3/out.json")))
 
-        row = {
-            "s1_job_id": j1.id,
-            "s2_job_id": j2.id,
-            "s3_job_id": j3.id,
-            "p1": j1.sp.get("p1"),
-            "p2": j2.sp.get("p2"),
-            "p3": j3.sp.get("p3"),
-            "s1_value": s1_out.get("value", j1.doc.get("s1_value")),
-            "s2_value2": s2_out.get("value2", j2.doc.get("s2_value2")),
-            "s3_value3": s3_out.get("value3", j3.doc.get("s3_value3")),
-        }
+        columns["s1_job_id"].append(j1.id)
+        columns["s2_job_id"].append(j2.id)
+        columns["s3_job_id"].append(j3.id)
+        columns["p1"].append(j1.sp.get("p1"))
+        columns["p2"].append(j2.sp.get("p2"))
+        columns["p3"].append(j3.sp.get("p3"))
+        columns["s1_value"].append(s1_out.get("value", j1.doc.get("s1_value")))
+        columns["s2_value2"].append(s2_out.get("value2", j2.doc.get("s2_value2")))
+        columns["s3_value3"].append(s3_out.get("value3", j3.doc.get("s3_value3")))
 
-        rows.append(row)
-
-    df = pd.DataFrame(rows).sort_values(["p1", "p2", "p3"]).reset_index(drop=True)
+    df = pd.DataFrame(columns).sort_values(["p1", "p2", "p3"]).reset_index(drop=True)
 
     df.to_csv("results_table.csv", index=False)
 
     print(df)
-    print(f"\nWrote results_table.csv and results_table.parquet with {len(df)} rows.")
+    print(f"\nWrote results_table.csv with {len(df)} rows.")
 
 
 if __name__ == "__main__":
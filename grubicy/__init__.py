@@ -25,7 +25,12 @@ from .migrate import (
     execute_migration,
     plan_migration,
 )
-from .collect import CollectedRow, collect_params_with_parents
+from .collect import (
+    CollectedRow,
+    CollectedTable,
+    collect_params_with_parents,
+    collect_table,
+)
 
 __all__ = [
     "ActionSpec",
@@ -49,6 +54,8 @@ __all__ = [
     "plan_migration",
     "execute_migration",
     "CollectedRow",
+    "CollectedTable",
     "collect_params_with_parents",
+    "collect_table",
     "load_spec",
 ]
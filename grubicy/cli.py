@@ -4,19 +4,24 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
 from pathlib import Path
-from typing import Dict
+from typing import TYPE_CHECKING, Dict
 
-import signac
-import tomli_w
-import tomllib
+if TYPE_CHECKING:
+    import signac
 
-from .collect import collect_params_with_parents
-from .materialize import materialize
-from .migrate import MigrationPlan, execute_migration, plan_migration
-from .row_render import render_row_workflow
-from .row_utils import ready_directories, submit_directories
-from .spec import load_spec
+# signac, msgspec, and the subcommand modules are imported inside the cmd_*
+# functions: every invocation (including --help and argument errors) pays the
+# full import graph otherwise, and signac's is large.
+
+
+def _dumps(obj) -> str:
+    """Serialize CLI output with msgspec's C encoder instead of stdlib json."""
+
+    import msgspec
+
+    return msgspec.json.format(msgspec.json.encode(obj), indent=2).decode()
 
 
 def _parse_key_values(items: list[str]) -> Dict[str, str]:
@@ -30,12 +35,16 @@ def _parse_key_values(items: list[str]) -> Dict[str, str]:
 
 
 def cmd_validate(args: argparse.Namespace) -> None:
+    from .spec import load_spec
+
     spec = load_spec(args.config)
     _ = spec.topological_actions()
     print(f"Validated config: {args.config}")
 
 
-def _get_or_init_project(path: str | None = None) -> signac.Project:
+def _get_or_init_project(path: str | None = None) -> "signac.Project":
+    import signac
+
     if path:
         try:
             return signac.Project(path)
@@ -48,26 +57,36 @@ def _get_or_init_project(path: str | None = None) -> signac.Project:
 
 
 def _update_config_for_defaults(
-    config_path: str, action_name: str, defaults: Dict[str, str]
+    config_path: str,
+    action_name: str,
+    defaults: Dict[str, str],
+    cfg: dict | None = None,
 ) -> None:
+    if not defaults:
+        return
     path = Path(config_path)
     if path.suffix.lower() != ".toml":
         return
-    data = path.read_text(encoding="utf-8")
-    try:
-        cfg = tomllib.loads(data)
-    except Exception:
-        return
+
+    if cfg is None:
+        import tomllib
+
+        try:
+            # Binary parse: tomllib decodes internally, so no intermediate
+            # file-sized str is built first.
+            with path.open("rb") as fp:
+                cfg = tomllib.load(fp)
+        except Exception:
+            return
     changed = False
     actions = cfg.get("actions") or []
     for entry in actions:
         if entry.get("name") != action_name:
             continue
-        sp_keys = set(entry.get("sp_keys", []))
-        before = set(sp_keys)
-        sp_keys.update(defaults.keys())
-        if sp_keys != before:
-            entry["sp_keys"] = list(sp_keys)
+        sp_keys = entry.get("sp_keys", [])
+        new_keys = [k for k in defaults if k not in sp_keys]
+        if new_keys:
+            entry["sp_keys"] = list(sp_keys) + new_keys
             changed = True
 
     experiments = cfg.get("experiments") or cfg.get("experiment") or []
@@ -83,36 +102,50 @@ def _update_config_for_defaults(
                 changed = True
 
     if changed:
-        path.write_text(tomli_w.dumps(cfg), encoding="utf-8")
+        import tomli_w
+
+        # tomli_w.dump writes incrementally to a binary stream, skipping the
+        # full-document str that dumps + write_text would build and re-encode.
+        with path.open("wb") as fp:
+            tomli_w.dump(cfg, fp)
 
 
 def cmd_materialize(args: argparse.Namespace) -> None:
+    from .materialize import materialize
+    from .spec import load_spec
+
     spec = load_spec(args.config)
     project = _get_or_init_project(args.project)
     report = materialize(spec, project, spec.experiments, dry_run=args.dry_run)
     if getattr(args, "format", "json") == "json":
-        print(json.dumps(report.__dict__, indent=2, default=str))
+        print(_dumps(report))
     else:
         counts = ",".join(f"{k}:{len(v)}" for k, v in report.per_action.items())
         print(f"materialize total={report.total} created={report.created} [{counts}]")
 
 
 def cmd_render_row(args: argparse.Namespace) -> None:
+    from .row_render import render_row_workflow
+    from .spec import load_spec
+
     spec = load_spec(args.config)
     out = render_row_workflow(spec, args.output)
     print(f"Wrote row workflow to {out}")
 
 
 def cmd_migrate_plan(args: argparse.Namespace) -> None:
-    spec = load_spec(args.config)
+    from .migrate import plan_migration
+    from .spec import load_spec_with_raw
+
+    # Keep the raw mapping so the defaults update below reuses this parse.
+    spec, raw_cfg = load_spec_with_raw(args.config)
     project = _get_or_init_project(args.project)
     defaults = _parse_key_values(args.setdefault)
 
     def transform(sp: dict) -> dict:
-        sp = dict(sp)
-        for k, v in defaults.items():
-            sp.setdefault(k, v)
-        return sp
+        # Later keys win, so existing sp values override the defaults —
+        # one C-level merge instead of a setdefault loop per job.
+        return {**defaults, **sp}
 
     plan, plan_path = plan_migration(
         spec,
@@ -121,11 +154,14 @@ def cmd_migrate_plan(args: argparse.Namespace) -> None:
         transform,
         collision_strategy=args.collision_strategy,
     )
-    _update_config_for_defaults(args.config, args.action, defaults)
+    _update_config_for_defaults(args.config, args.action, defaults, cfg=raw_cfg)
     print(f"Wrote migration plan: {plan_path}")
 
 
 def cmd_migrate_execute(args: argparse.Namespace) -> None:
+    from .migrate import MigrationPlan, execute_migration
+    from .spec import load_spec
+
     spec = load_spec(args.config)
     project = _get_or_init_project(args.project)
     plan_path = _resolve_plan_path(project, args.plan)
@@ -143,68 +179,133 @@ def cmd_migrate_execute(args: argparse.Namespace) -> None:
         print(f"apply plan {plan_path} updated {{{counts}}}")
 
 
+def _first_missing_product(job_path: str, outputs: list[str]) -> str | None:
+    """Return the first absent product (or None), with one readdir per directory."""
+
+    listings: Dict[str, set[str]] = {}
+    for prod in outputs:
+        dirname, _, filename = prod.rpartition("/")
+        listing = listings.get(dirname)
+        if listing is None:
+            prod_dir = os.path.join(job_path, dirname) if dirname else job_path
+            try:
+                listing = {entry.name for entry in os.scandir(prod_dir)}
+            except FileNotFoundError:
+                listing = set()
+            listings[dirname] = listing
+        if filename not in listing:
+            return prod
+    return None
+
+
 def cmd_status(args: argparse.Namespace) -> None:
+    from collections import defaultdict
+    from concurrent.futures import ThreadPoolExecutor
+    from functools import partial
+
+    from .spec import load_spec
+
     spec = load_spec(args.config)
     project = _get_or_init_project(args.project)
+    # Bin the whole workspace in one walk instead of one find_jobs traversal
+    # per action.
+    jobs_by_action: Dict[str, list] = defaultdict(list)
+    for job in project:
+        jobs_by_action[job.sp.get("action")].append(job)
+    # Miss counts from prior runs, stored per action as [product, count]
+    # pairs (signac doc keys cannot contain the dots in product names).
+    prior_cache = project.doc.get("status_cache", {})
+    miss_cache: Dict[str, list] = {}
     summary = {}
     for action in spec.actions:
-        jobs = list(project.find_jobs({"action": action.name}))
+        jobs = jobs_by_action.get(action.name, [])
+        outputs = list(action.outputs or ())
+        miss_counts: Dict[str, int] = dict(prior_cache.get(action.name, ()))
+        if miss_counts and len(outputs) > 1:
+            # Probe the historically most-missing product first so most jobs
+            # settle after a single lookup.
+            outputs.sort(key=lambda prod: miss_counts.get(prod, 0), reverse=True)
         missing_products = 0
-        for job in jobs:
-            for prod in action.outputs or []:
-                if not Path(job.fn(prod)).exists():
-                    missing_products += 1
-                    break
+        if outputs and jobs:
+            # The probes are independent stat/readdir calls that release the
+            # GIL, so overlap them instead of paying each latency in turn.
+            # partial binds this iteration's outputs list; a closure over the
+            # loop variable would silently rebind if map were consumed later.
+            probe = partial(_first_missing_product, outputs=outputs)
+            with ThreadPoolExecutor(max_workers=min(32, len(jobs))) as executor:
+                for first_missing in executor.map(probe, [job.path for job in jobs]):
+                    if first_missing is not None:
+                        missing_products += 1
+                        miss_counts[first_missing] = (
+                            miss_counts.get(first_missing, 0) + 1
+                        )
+        if miss_counts:
+            miss_cache[action.name] = sorted(miss_counts.items())
         summary[action.name] = {
             "count": len(jobs),
             "missing_products": missing_products,
         }
+    if miss_cache:
+        project.doc["status_cache"] = miss_cache
     if getattr(args, "missing_only", False):
         summary = {k: v for k, v in summary.items() if v["missing_products"]}
     if getattr(args, "format", "json") == "json":
-        print(json.dumps(summary, indent=2))
+        print(_dumps(summary))
     else:
         for name, meta in summary.items():
             print(f"{name}: count={meta['count']} missing={meta['missing_products']}")
 
 
 def cmd_collect_params(args: argparse.Namespace) -> None:
+    from .collect import collect_params_with_parents, collect_table
+    from .spec import load_spec
+
     spec = load_spec(args.config)
     project = _get_or_init_project(args.project)
-    rows = collect_params_with_parents(
+    if args.format == "json":
+        rows = collect_params_with_parents(
+            spec,
+            project,
+            args.action,
+            include_doc=args.include_doc,
+            missing_ok=args.missing_ok,
+        )
+        text = json.dumps([row.data for row in rows], indent=2)
+        if args.output:
+            Path(args.output).write_text(text, encoding="utf-8")
+        else:
+            print(text)
+        return
+
+    # csv: the columnar table writes rows as plain tuples, no dict per row.
+    import csv
+    import sys
+
+    table = collect_table(
         spec,
         project,
         args.action,
         include_doc=args.include_doc,
         missing_ok=args.missing_ok,
     )
-    if args.format == "json":
-        payload = [row.data for row in rows]
-        text = json.dumps(payload, indent=2)
-    else:
-        # csv
-        import csv
-        from io import StringIO
-
-        payload = [row.data for row in rows]
-        # Union of keys in order of appearance
-        keys: list[str] = []
-        for row in payload:
-            for k in row.keys():
-                if k not in keys:
-                    keys.append(k)
-        buffer = StringIO()
-        writer = csv.DictWriter(buffer, fieldnames=keys)
-        writer.writeheader()
-        writer.writerows(payload)
-        text = buffer.getvalue()
+
+    def _write_csv(stream) -> None:
+        writer = csv.writer(stream)
+        writer.writerow(table.columns)
+        writer.writerows(zip(*table.columns.values()))
+
     if args.output:
-        Path(args.output).write_text(text, encoding="utf-8")
+        with open(args.output, "w", encoding="utf-8", newline="") as stream:
+            _write_csv(stream)
     else:
-        print(text)
+        _write_csv(sys.stdout)
 
 
 def cmd_prepare(args: argparse.Namespace) -> None:
+    from .materialize import materialize
+    from .row_render import render_row_workflow
+    from .spec import load_spec
+
     spec = load_spec(args.config)
     project = _get_or_init_project(args.project)
     materialize(spec, project, spec.experiments, dry_run=False)
@@ -218,6 +319,9 @@ def cmd_prepare(args: argparse.Namespace) -> None:
 
 
 def cmd_submit(args: argparse.Namespace) -> None:
+    from .row_utils import ready_directories, submit_directories
+    from .spec import load_spec
+
     spec = load_spec(args.config)
     project = _get_or_init_project(args.project)
     project_path = Path(project.path)
@@ -253,13 +357,26 @@ def cmd_submit(args: argparse.Namespace) -> None:
     print(f"Submitted {len(ready)} directories via row.")
 
 
-def _resolve_plan_path(project: signac.Project, provided: str | None) -> Path:
+def _resolve_plan_path(project: "signac.Project", provided: str | None) -> Path:
     if provided:
         return Path(provided)
-    plans = sorted(Path(project.path).glob(".pipeline_migrations/plan_*.json"))
-    if not plans:
+    plans_dir = Path(project.path) / ".pipeline_migrations"
+    # Track the lexicographic max directly; glob would build a Path per plan
+    # and sorting the whole listing just to take the last entry is wasted work.
+    latest: str | None = None
+    try:
+        with os.scandir(plans_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                if not (name.startswith("plan_") and name.endswith(".json")):
+                    continue
+                if latest is None or name > latest:
+                    latest = name
+    except FileNotFoundError:
+        pass
+    if latest is None:
         raise SystemExit("No migration plans found; specify --plan")
-    return plans[-1]
+    return plans_dir / latest
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Dict, List, Mapping, Sequence
+from typing import Dict, Iterator, List, Mapping, Sequence
 
 import signac
 
@@ -16,6 +16,27 @@ class CollectedRow(msgspec.Struct):
     data: Dict[str, object]
 
 
+class CollectedTable(msgspec.Struct):
+    """Column-oriented collection result: one value list per column.
+
+    Stores the same data as a list of :class:`CollectedRow` but without a
+    dict per row, which matters for wide schemas over many jobs.
+    """
+
+    columns: Dict[str, List[object]]
+    count: int = 0
+
+    def iter_rows(self) -> Iterator[Dict[str, object]]:
+        """Yield per-row dicts (omitting columns absent for a row)."""
+
+        for idx in range(self.count):
+            yield {
+                key: values[idx]
+                for key, values in self.columns.items()
+                if values[idx] is not None
+            }
+
+
 _RESERVED_DOC_KEYS = {"deps_meta", "pipeline", "pipeline_meta"}
 
 
@@ -34,11 +55,55 @@ class ParamCollector:
         self.project = project
         self.include_doc = include_doc
         self.missing_ok = missing_ok
-        self._action_map: Dict[str, ActionSpec] = {a.name: a for a in spec.actions}
+        self._action_map: Dict[str, ActionSpec] = spec.action_by_name
+        # Column names are invariant across rows, so build the "<action>.<key>"
+        # strings once instead of re-formatting them for every cell.
+        self._prefixed_sp_keys: Dict[str, List[tuple[str, str]]] = {
+            a.name: [(key, f"{a.name}.{key}") for key in a.sp_keys]
+            for a in spec.actions
+        }
+        self._doc_prefixes: Dict[str, str] = {
+            a.name: f"{a.name}.doc." for a in spec.actions
+        }
+        # Many leaves share the same ancestors, so parent jobs are opened at
+        # most once per collector.
+        self._job_cache: Dict[str, signac.Job | None] = {}
 
     def collect(self, target_action: str) -> List[CollectedRow]:
+        return [
+            CollectedRow(data=flattened)
+            for flattened in self._iter_flattened(target_action)
+        ]
+
+    def collect_table(self, target_action: str) -> CollectedTable:
+        """Collect into a column-oriented table instead of per-row dicts."""
+
+        columns: Dict[str, List[object]] = {}
+        count = 0
+        for flattened in self._iter_flattened(target_action):
+            for key, value in flattened.items():
+                col = columns.get(key)
+                if col is None:
+                    # Backfill rows seen before this column appeared.
+                    col = [None] * count
+                    columns[key] = col
+                col.append(value)
+            count += 1
+            for col in columns.values():
+                if len(col) < count:
+                    col.append(None)
+        return CollectedTable(columns=columns, count=count)
+
+    def _iter_flattened(self, target_action: str) -> Iterator[Dict[str, object]]:
         chain = self._action_chain(target_action)
-        rows: List[CollectedRow] = []
+        ancestors = set(chain[:-1])
+        if ancestors and not self._job_cache:
+            # One pass over the workspace seeds the id map; per-leaf chain
+            # walks then resolve parents with dict lookups instead of a
+            # random-access open_job per link.
+            for job in self.project:
+                if job.sp.get("action") in ancestors:
+                    self._job_cache[job.id] = job
 
         for leaf in self.project.find_jobs({"action": target_action}):
             job_map = self._resolve_parents(chain, leaf)
@@ -49,10 +114,7 @@ class ParamCollector:
                     f"Missing parent for job {leaf.id} when collecting {target_action}"
                 )
 
-            flattened = self._flatten_row(chain, job_map)
-            rows.append(CollectedRow(data=flattened))
-
-        return rows
+            yield self._flatten_row(chain, job_map)
 
     def _action_chain(self, action_name: str) -> Sequence[str]:
         names: List[str] = []
@@ -83,14 +145,25 @@ class ParamCollector:
             parent_id = child_job.sp.get(dep_key)
             if parent_id is None:
                 return None
-            try:
-                parent_job = self.project.open_job(id=str(parent_id))
-            except LookupError:
+            parent_job = self._open_job_cached(str(parent_id))
+            if parent_job is None:
                 return None
             job_map[parent_name] = parent_job
 
         return job_map
 
+    def _open_job_cached(self, job_id: str) -> signac.Job | None:
+        """Open a job by id, reusing handles across leaves (None if missing)."""
+
+        job = self._job_cache.get(job_id)
+        if job is None and job_id not in self._job_cache:
+            try:
+                job = self.project.open_job(id=job_id)
+            except LookupError:
+                job = None
+            self._job_cache[job_id] = job
+        return job
+
     def _flatten_row(
         self, chain: Sequence[str], job_map: Mapping[str, signac.Job]
     ) -> Dict[str, object]:
@@ -98,15 +171,16 @@ class ParamCollector:
 
         for name in chain:
             part = job_map[name]
-            action_spec = self._action_map[name]
-            for key in action_spec.sp_keys:
-                if key in part.sp:
-                    row[f"{name}.{key}"] = part.sp[key]
+            sp = part.sp
+            for key, column in self._prefixed_sp_keys[name]:
+                if key in sp:
+                    row[column] = sp[key]
             if self.include_doc:
+                doc_prefix = self._doc_prefixes[name]
                 for dkey, dval in part.doc.items():
                     if dkey in _RESERVED_DOC_KEYS:
                         continue
-                    row[f"{name}.doc.{dkey}"] = dval
+                    row[doc_prefix + dkey] = dval
 
         return row
 
@@ -139,3 +213,23 @@ def collect_params_with_parents(
         spec=spec, project=project, include_doc=include_doc, missing_ok=missing_ok
     )
     return collector.collect(target_action)
+
+
+def collect_table(
+    spec: WorkflowSpec,
+    project: signac.Project,
+    target_action: str,
+    *,
+    include_doc: bool = False,
+    missing_ok: bool = False,
+) -> CollectedTable:
+    """Collect a column-oriented table of flattened params/docs.
+
+    Same semantics as :func:`collect_params_with_parents` but returns a
+    :class:`CollectedTable`, avoiding a dict per row for large projects.
+    """
+
+    collector = ParamCollector(
+        spec=spec, project=project, include_doc=include_doc, missing_ok=missing_ok
+    )
+    return collector.collect_table(target_action)
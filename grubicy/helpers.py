@@ -7,6 +7,11 @@ from typing import Iterator
 
 import signac
 
+# Projects resolved by open_job_from_directory, keyed by the directory's parent
+# (the workspace root). Row dispatches many directories of one project in a
+# single process, so the search walk only happens once per workspace.
+_project_cache: dict[str, signac.Project] = {}
+
 
 class DependencyResolutionError(Exception):
     """Raised when a job's parent cannot be resolved."""
@@ -74,14 +79,14 @@ def iter_parent_products(job: signac.Job, pattern: str = "*") -> Iterator[Path]:
 def open_job_from_directory(directory: str) -> signac.Job:
     """Open a job by workspace directory name (as passed by row)."""
     dir_path = Path(directory)
-    if dir_path.exists():
-        base = dir_path
-    else:
-        base = dir_path
-    try:
-        project = signac.Project.get_project(path=base, search=True)
-    except LookupError:
-        project = signac.get_project()
+    cache_key = str(dir_path.parent)
+    project = _project_cache.get(cache_key)
+    if project is None:
+        try:
+            project = signac.Project.get_project(path=dir_path, search=True)
+        except LookupError:
+            project = signac.get_project()
+        _project_cache[cache_key] = project
     return project.open_job(id=dir_path.name)
 
 
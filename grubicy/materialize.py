@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
-from pathlib import Path
-from typing import Dict, Iterable, List, Mapping, Optional
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
 
 import signac
 
@@ -36,6 +37,16 @@ class Materializer:
             per_action={}, created=0, total=0, dry_run=dry_run
         )
         self._action_order = spec.topological_actions()
+        # Per-action invariants resolved once so the per-job loop skips the
+        # dependency attribute chain and branch.
+        self._action_plan: List[Tuple[ActionSpec, Optional[str]]] = [
+            (action, action.dependency.sp_key if action.dependency else None)
+            for action in self._action_order
+        ]
+        self._pending_deps: Dict[str, Tuple[signac.Job, Dict[str, dict]]] = {}
+        # Parent statepoints materialized once per parent; every child of the
+        # same parent shares the dict instead of re-copying job.sp.
+        self._parent_sp_cache: Dict[str, Dict[str, object]] = {}
 
     def run(
         self, experiments: Iterable[Mapping[str, Mapping[str, object]]]
@@ -58,36 +69,73 @@ class Materializer:
             If experiments include unknown parameters or are missing required parents.
         """
 
-        for exp_index, experiment in enumerate(experiments):
-            self._materialize_experiment(exp_index, experiment)
+        experiments = list(experiments)
+        if experiments:
+            # Every action yields exactly one job per experiment, so the bucket
+            # sizes are known up front; index assignment avoids list growth.
+            self.report.per_action = {
+                action.name: [None] * len(experiments)
+                for action in self._action_order
+            }
+        max_workers = min(8, len(experiments))
+        if max_workers > 1:
+            # Experiments only touch their own jobs, so the mkdir/JSON I/O of
+            # job initialization can overlap across a thread pool.
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results = list(
+                    executor.map(
+                        self._materialize_experiment,
+                        range(len(experiments)),
+                        experiments,
+                    )
+                )
+        else:
+            results = [
+                self._materialize_experiment(exp_index, experiment)
+                for exp_index, experiment in enumerate(experiments)
+            ]
+
+        created_ids: set[str] = set()
+        for exp_index, records in enumerate(results):
+            for action_name, job_id, created in records:
+                self._record_job(action_name, job_id, exp_index)
+                if created:
+                    created_ids.add(job_id)
+        self.report.created = len(created_ids)
+
+        self._flush_dependency_metadata()
 
         return self.report
 
     def _materialize_experiment(
         self, exp_index: int, experiment: Mapping[str, Mapping[str, object]]
-    ) -> None:
+    ) -> List[Tuple[str, str, bool]]:
         parent_jobs: Dict[str, signac.Job] = {}
+        records: List[Tuple[str, str, bool]] = []
 
-        for action in self._action_order:
+        for action, dep_sp_key in self._action_plan:
             params = experiment.get(action.name, {}) or {}
             filtered_params = self._validate_params(params, action.sp_keys, action.name)
 
             parent_job = self._resolve_parent(action, parent_jobs, exp_index)
-            statepoint = self._build_statepoint(action, filtered_params, parent_job)
+            statepoint = {"action": action.name, **filtered_params}
+            if dep_sp_key and parent_job:
+                statepoint[dep_sp_key] = parent_job.id
 
             job = self.project.open_job(statepoint)
-            self._record_job(action.name, job.id)
             if self.dry_run:
                 parent_jobs[action.name] = job
+                records.append((action.name, job.id, False))
                 continue
 
             created = self._init_job(job)
             if parent_job:
-                self._write_dependency_metadata(job, parent_job)
+                self._stage_dependency_metadata(job, parent_job)
 
             parent_jobs[action.name] = job
-            if created:
-                self.report.created += 1
+            records.append((action.name, job.id, created))
+
+        return records
 
     @staticmethod
     def _validate_params(
@@ -95,39 +143,44 @@ class Materializer:
     ) -> Dict[str, object]:
         """Whitelist parameters against ``sp_keys`` and reject extras."""
 
+        if not params:
+            return {}
         sp_key_set = set(sp_keys)
-        extras = set(params) - sp_key_set
+        extras = params.keys() - sp_key_set
         if extras:
             raise ConfigValidationError(
                 f"Action '{action_name}' received unknown parameter keys: {sorted(extras)}"
             )
-        return {k: params[k] for k in sp_keys if k in params}
-
-    @staticmethod
-    def _build_statepoint(
-        action: ActionSpec,
-        params: Mapping[str, object],
-        parent_job: Optional[signac.Job],
-    ) -> Dict[str, object]:
-        statepoint = {"action": action.name, **params}
-        if action.dependency and parent_job:
-            statepoint[action.dependency.sp_key] = parent_job.id
-        return statepoint
+        return {k: v for k, v in params.items() if k in sp_key_set}
 
     @staticmethod
     def _init_job(job: signac.Job) -> bool:
-        created = not Path(job.path).exists()
+        created = not os.path.exists(job.path)
         job.init()
         return created
 
-    @staticmethod
-    def _write_dependency_metadata(job: signac.Job, parent_job: signac.Job) -> None:
-        deps_meta = dict(job.doc.get("deps_meta", {}))
-        deps_meta[parent_job.sp.get("action", parent_job.id)] = {
+    def _stage_dependency_metadata(self, job: signac.Job, parent_job: signac.Job) -> None:
+        """Record a parent entry to be written to ``job.doc`` in one batch."""
+
+        parent_sp = self._parent_sp_cache.get(parent_job.id)
+        if parent_sp is None:
+            parent_sp = dict(parent_job.sp)
+            self._parent_sp_cache[parent_job.id] = parent_sp
+
+        _, staged = self._pending_deps.setdefault(job.id, (job, {}))
+        staged[parent_sp.get("action", parent_job.id)] = {
             "job_id": parent_job.id,
-            "statepoint": dict(parent_job.sp),
+            "statepoint": parent_sp,
         }
-        job.doc["deps_meta"] = deps_meta
+
+    def _flush_dependency_metadata(self) -> None:
+        """Write staged ``deps_meta`` entries with one doc update per job."""
+
+        for job, staged in self._pending_deps.values():
+            deps_meta = dict(job.doc.get("deps_meta", {}))
+            deps_meta.update(staged)
+            job.doc["deps_meta"] = deps_meta
+        self._pending_deps.clear()
 
     def _resolve_parent(
         self,
@@ -139,17 +192,16 @@ class Materializer:
             return None
 
         parent_action = action.dependency.action
-        try:
-            return parent_jobs[parent_action]
-        except KeyError as exc:
+        parent_job = parent_jobs.get(parent_action)
+        if parent_job is None:
             raise ConfigValidationError(
                 f"Experiment #{exp_index} is missing parameters for parent action '{parent_action}'"
-            ) from exc
+            )
+        return parent_job
 
-    def _record_job(self, action_name: str, job_id: str) -> None:
+    def _record_job(self, action_name: str, job_id: str, exp_index: int) -> None:
         self.report.total += 1
-        bucket = self.report.per_action.setdefault(action_name, [])
-        bucket.append(job_id)
+        self.report.per_action[action_name][exp_index] = job_id
 
 
 def materialize(
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import os
 import shutil
 from collections import defaultdict
 from datetime import UTC, datetime
@@ -39,15 +40,15 @@ class MigrationPlan(msgspec.Struct):
 
     @classmethod
     def from_path(cls, path: Path) -> "MigrationPlan":
-        return msgspec.json.decode(path.read_bytes(), type=cls)
+        return _PLAN_DECODER.decode(path.read_bytes())
 
     def save(self, path: Path) -> None:
-        path.write_bytes(msgspec.json.encode(self))
+        path.write_bytes(_JSON_ENCODER.encode(self))
 
     def to_json(self) -> str:
         """Return the plan as a JSON string."""
 
-        return msgspec.json.encode(self).decode("utf-8")
+        return _JSON_ENCODER.encode(self).decode("utf-8")
 
 
 class MigrationReport(msgspec.Struct):
@@ -59,7 +60,7 @@ class MigrationReport(msgspec.Struct):
     def to_json(self) -> str:
         """Return the report as a JSON string."""
 
-        return msgspec.json.encode(self).decode("utf-8")
+        return _JSON_ENCODER.encode(self).decode("utf-8")
 
 
 class MigrationProgress(msgspec.Struct):
@@ -71,6 +72,13 @@ class MigrationProgress(msgspec.Struct):
     timestamp: str
 
 
+# Reusable encoder/decoder instances: constructing them per call repeats the
+# type-resolution setup that msgspec can amortize once at import.
+_JSON_ENCODER = msgspec.json.Encoder()
+_PLAN_DECODER = msgspec.json.Decoder(MigrationPlan)
+_PROGRESS_DECODER = msgspec.json.Decoder(MigrationProgress)
+
+
 def _run_dir(
     project: signac.Project, plan: MigrationPlan, plan_path: Optional[Path]
 ) -> Path:
@@ -93,7 +101,7 @@ def _run_dir(
 def _write_progress(run_dir: Path, progress: "MigrationProgress") -> None:
     run_dir.mkdir(parents=True, exist_ok=True)
     path = run_dir / "progress.json"
-    path.write_bytes(msgspec.json.encode(progress))
+    path.write_bytes(_JSON_ENCODER.encode(progress))
 
 
 def _read_progress(path: Path) -> Optional["MigrationProgress"]:
@@ -102,18 +110,24 @@ def _read_progress(path: Path) -> Optional["MigrationProgress"]:
     except FileNotFoundError:
         return None
     try:
-        return msgspec.json.decode(raw, type=MigrationProgress)
+        return _PROGRESS_DECODER.decode(raw)
     except msgspec.DecodeError:
         return None
 
 
-def _maybe_move_workspace(old_path: Path, new_path: Path) -> None:
+def _maybe_move_workspace(old_path: str, new_path: str) -> None:
     if old_path == new_path:
         return
-    if not old_path.exists():
+    if not os.path.exists(old_path):
         return
-    new_path.parent.mkdir(parents=True, exist_ok=True)
-    shutil.copytree(old_path, new_path, dirs_exist_ok=True)
+    os.makedirs(os.path.dirname(new_path), exist_ok=True)
+    try:
+        # Same-filesystem moves are a metadata-only rename instead of copying
+        # every byte of the workspace.
+        os.rename(old_path, new_path)
+    except OSError:
+        # Cross-device move or non-empty destination: merge by copying.
+        shutil.copytree(old_path, new_path, dirs_exist_ok=True)
 
 
 def _default_plan_path(project: signac.Project, action_name: str) -> Path:
@@ -135,13 +149,15 @@ def plan_migration(
 ) -> tuple[MigrationPlan, Path]:
     """Create a migration plan for a single action.
 
-    The plan computes old->new state points and detects collisions before any mutation.
+    The plan computes old->new state points and detects collisions before any
+    mutation. ``sp_transform`` receives its own copy of the state point and
+    must return a ``dict``.
     """
 
     if collision_strategy not in {"abort", "keep-first"}:
         raise ValueError("collision_strategy must be 'abort' or 'keep-first'")
 
-    if action_name not in {a.name for a in spec.actions}:
+    if action_name not in spec.action_by_name:
         raise ConfigValidationError(f"Unknown action '{action_name}'")
 
     query = {"action": action_name}
@@ -149,11 +165,14 @@ def plan_migration(
         query.update(selection)
 
     entries: List[MigrationEntry] = []
-    collision_targets: Dict[str, List[str]] = {}
+    seen_targets: set[str] = set()
+    collisions: List[str] = []
 
     for job in project.find_jobs(query):
+        # One read of job.sp; the transform gets a plain-dict copy of it
+        # rather than a second signac metadata load.
         old_sp = dict(job.sp)
-        new_sp = dict(sp_transform(dict(job.sp)))
+        new_sp = sp_transform(old_sp.copy())
         # Ensure action remains consistent.
         new_sp["action"] = action_name
         new_job = project.open_job(new_sp)
@@ -161,11 +180,14 @@ def plan_migration(
             old_id=job.id, new_id=new_job.id, old_sp=old_sp, new_sp=new_sp
         )
         entries.append(entry)
-        collision_targets.setdefault(new_job.id, []).append(job.id)
+        # Only "more than one source" matters, so track targets in a set
+        # instead of accumulating source lists per target.
+        if new_job.id in seen_targets:
+            if new_job.id not in collisions:
+                collisions.append(new_job.id)
+        else:
+            seen_targets.add(new_job.id)
 
-    collisions = [
-        target for target, sources in collision_targets.items() if len(sources) > 1
-    ]
     if collisions and collision_strategy == "abort":
         raise MigrationCollisionError(
             f"Collisions detected for new job ids: {collisions}"
@@ -219,6 +241,10 @@ class MigrationExecutor:
         self.run_dir = run_dir
         self.plan_path = plan_path
         self.progress_path = run_dir / "progress.json"
+        self._action_order = spec.topological_actions()
+        # Parent (action, statepoint) pairs loaded at most once per parent;
+        # fan-out children reuse them when rewriting deps_meta.
+        self._parent_meta_cache: Dict[str, tuple[str, StatePoint]] = {}
         self.mapping_by_action: Dict[str, Dict[str, str]] = {}
         self.updated_counts = defaultdict(int)
         if resume:
@@ -243,23 +269,42 @@ class MigrationExecutor:
 
     def _apply_primary_action(self) -> Dict[str, str]:
         primary_map: Dict[str, str] = {}
+        # One workspace scan instead of an index lookup per plan entry.
+        jobs_by_id = {
+            job.id: job
+            for job in self.project.find_jobs({"action": self.plan.action_name})
+        }
+        workspace = self.project.workspace
         for entry in self.plan.entries:
-            job = self.project.open_job(id=entry.old_id)
-            old_path = Path(job.path)
-            if job.sp == entry.new_sp:
+            # No-op entries resolve with a plain dict compare, before any
+            # job handle or path is touched.
+            if entry.old_sp == entry.new_sp:
+                primary_map[entry.old_id] = entry.new_id
+                continue
+            job = jobs_by_id.get(entry.old_id)
+            if job is None or job.sp == entry.new_sp:
+                # Already migrated, e.g. resuming after a partial run.
                 primary_map[entry.old_id] = entry.new_id
                 continue
+            old_path = job.path
             job.sp = entry.new_sp
-            new_path = Path(self.project.open_job(entry.new_sp).path)
+            # Workspace layout is deterministic by id, so the destination path
+            # follows from entry.new_id without opening the new job.
+            new_path = os.path.join(workspace, entry.new_id)
             _maybe_move_workspace(old_path, new_path)
             primary_map[entry.old_id] = entry.new_id
             self._increment_updated(self.plan.action_name)
         return primary_map
 
     def _cascade_downstream(self) -> None:
-        topo = self.spec.topological_actions()
         downstream_started = False
-        for action in topo:
+        # One walk over the project feeds every downstream action; find_jobs
+        # would re-scan the workspace metadata once per action.
+        jobs_by_action: Dict[str, List[signac.Job]] = defaultdict(list)
+        for job in self.project:
+            jobs_by_action[job.sp.get("action")].append(job)
+
+        for action in self._action_order:
             if action.name == self.plan.action_name:
                 downstream_started = True
                 continue
@@ -272,25 +317,27 @@ class MigrationExecutor:
 
             parent_map = self.mapping_by_action[parent_action]
             current_map: Dict[str, str] = self.mapping_by_action.get(action.name, {})
+            dep_key = action.dependency.sp_key
+            action_name = action.name
 
-            for job in self.project.find_jobs({"action": action.name}):
-                dep_key = action.dependency.sp_key
-                parent_id = job.sp.get(dep_key)
-                if parent_id not in parent_map:
+            for job in jobs_by_action.get(action_name, ()):
+                # Copy the statepoint once; reading job.sp repeatedly reloads
+                # the signac metadata for each access.
+                new_sp = dict(job.sp)
+                new_parent_id = parent_map.get(new_sp.get(dep_key))
+                if new_parent_id is None:
                     continue
 
-                new_parent_id = parent_map[parent_id]
                 old_id = job.id
-                new_sp = dict(job.sp)
                 new_sp[dep_key] = new_parent_id
-                new_sp["action"] = action.name
+                new_sp["action"] = action_name
                 new_job = self.project.open_job(new_sp)
                 if new_job.id == job.id:
                     continue
 
-                old_path = Path(job.path)
+                old_path = job.path
                 job.sp = new_sp
-                new_path = Path(new_job.path)
+                new_path = new_job.path
                 _maybe_move_workspace(old_path, new_path)
                 self._update_deps_meta(job, new_parent_id)
 
@@ -301,12 +348,20 @@ class MigrationExecutor:
                 self.mapping_by_action[action.name] = current_map
                 self._write_progress(done=False)
 
+    def _parent_meta(self, parent_id: str) -> tuple[str, StatePoint]:
+        cached = self._parent_meta_cache.get(parent_id)
+        if cached is None:
+            parent_sp = dict(self.project.open_job(id=parent_id).sp)
+            cached = (parent_sp.get("action", parent_id), parent_sp)
+            self._parent_meta_cache[parent_id] = cached
+        return cached
+
     def _update_deps_meta(self, job: signac.Job, new_parent_id: str) -> None:
-        parent_job = self.project.open_job(id=new_parent_id)
+        action_key, parent_sp = self._parent_meta(new_parent_id)
         deps_meta = dict(job.doc.get("deps_meta", {}))
-        deps_meta[parent_job.sp.get("action", parent_job.id)] = {
-            "job_id": parent_job.id,
-            "statepoint": dict(parent_job.sp),
+        deps_meta[action_key] = {
+            "job_id": new_parent_id,
+            "statepoint": parent_sp,
         }
         job.doc["deps_meta"] = deps_meta
 
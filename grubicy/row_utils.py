@@ -3,10 +3,13 @@
 from __future__ import annotations
 
 import fnmatch
+import re
 import subprocess
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable, Sequence
+from typing import Iterable, Iterator, Sequence
 
 import signac
 
@@ -18,11 +21,16 @@ class RowCLIError(RuntimeError):
     """Raised when a row command fails."""
 
 
-def _run_row(cmd: Sequence[str], cwd: Path) -> subprocess.CompletedProcess[str]:
+def _run_row(
+    cmd: Sequence[str], cwd: Path, capture: bool = True
+) -> subprocess.CompletedProcess[str]:
     result = subprocess.run(
         cmd,
         cwd=str(cwd),
-        capture_output=True,
+        # Callers that ignore stdout (submit) skip buffering it entirely;
+        # stderr is always captured for error reporting.
+        stdout=subprocess.PIPE if capture else subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
         text=True,
         check=False,
     )
@@ -33,26 +41,42 @@ def _run_row(cmd: Sequence[str], cwd: Path) -> subprocess.CompletedProcess[str]:
     return result
 
 
+def _iter_row_lines(cmd: Sequence[str], cwd: Path) -> Iterator[str]:
+    """Yield stdout lines from a row command without buffering the full output."""
+
+    # stderr spills to a temp file rather than a pipe: reading a stderr pipe
+    # only after stdout is drained deadlocks once the child fills the pipe
+    # buffer while stdout is still open.
+    with tempfile.TemporaryFile() as stderr_spool:
+        with subprocess.Popen(
+            cmd,
+            cwd=str(cwd),
+            stdout=subprocess.PIPE,
+            stderr=stderr_spool,
+            text=True,
+        ) as proc:
+            assert proc.stdout is not None
+            yield from proc.stdout
+        if proc.returncode != 0:
+            stderr_spool.seek(0)
+            stderr = stderr_spool.read().decode(errors="replace")
+            raise RowCLIError(f"row command failed ({' '.join(cmd)}): {stderr}")
+
+
+# Matches one directory name per line. Directory names contain no whitespace,
+# so this also skips blank lines and row's "No matches." sentinel in one pass.
+_DIRECTORY_LINE = re.compile(r"^[ \t]*(\S+)[ \t\r]*$")
+
+
 def _list_directories_with_status(
     project_path: Path, status_flag: str, action: str
 ) -> set[str]:
     cmd = ["row", "show", "directories", status_flag, "--short", "--action", action]
-    result = _run_row(cmd, project_path)
-    lines = []
-    for line in result.stdout.splitlines():
-        stripped = line.strip()
-        if not stripped:
-            continue
-        if stripped.lower() == "no matches.":
-            continue
-        lines.append(stripped)
-    return set(lines)
-
-
-def _matches_action(name: str, pattern: str | None) -> bool:
-    if pattern in (None, "*"):
-        return True
-    return fnmatch.fnmatch(name, pattern)
+    return {
+        match.group(1)
+        for line in _iter_row_lines(cmd, project_path)
+        if (match := _DIRECTORY_LINE.search(line))
+    }
 
 
 @dataclass
@@ -73,13 +97,26 @@ def _gather_row_status(project_path: Path, action_names: list[str]) -> RowStatus
     waiting: set[str] = set()
     eligible_by_action: dict[str, set[str]] = {}
 
-    for name in action_names:
-        completed |= _list_directories_with_status(project_path, "--completed", name)
-        submitted |= _list_directories_with_status(project_path, "--submitted", name)
-        waiting |= _list_directories_with_status(project_path, "--waiting", name)
-        eligible_by_action[name] = _list_directories_with_status(
-            project_path, "--eligible", name
+    # Each (status, action) pair is an independent row invocation; run them
+    # concurrently so the subprocess latency overlaps instead of stacking.
+    queries = [
+        (flag, name)
+        for name in action_names
+        for flag in ("--completed", "--submitted", "--waiting", "--eligible")
+    ]
+    with ThreadPoolExecutor(max_workers=min(16, len(queries) or 1)) as executor:
+        results = executor.map(
+            lambda query: _list_directories_with_status(project_path, *query), queries
         )
+        for (flag, name), directories in zip(queries, results):
+            if flag == "--completed":
+                completed |= directories
+            elif flag == "--submitted":
+                submitted |= directories
+            elif flag == "--waiting":
+                waiting |= directories
+            else:
+                eligible_by_action[name] = directories
 
     return RowStatus(
         completed=completed,
@@ -89,23 +126,27 @@ def _gather_row_status(project_path: Path, action_names: list[str]) -> RowStatus
     )
 
 
-def _job_is_ready(job: signac.Job, action, status: RowStatus) -> bool:
-    if job.id in status.blocked:
-        return False
-
-    eligible_set = status.eligible_by_action.get(action.name, set())
-    if eligible_set and job.id not in eligible_set:
-        return False
-
-    dep = action.dependency
-    if not dep:
+def _parent_completed(
+    job: signac.Job,
+    action,
+    status: RowStatus,
+    parent_cache: dict[str | None, signac.Job | None],
+) -> bool:
+    if not action.dependency:
         return True
 
-    try:
-        parent_job = get_parent(job)
-    except DependencyResolutionError:
-        return False
-    return parent_job.id in status.completed
+    # Children of the same parent share the resolution, so cache it by the
+    # referenced parent id instead of opening the job again per child.
+    parent_id = job.sp.get("parent_action")
+    if parent_id in parent_cache:
+        parent_job = parent_cache[parent_id]
+    else:
+        try:
+            parent_job = get_parent(job)
+        except DependencyResolutionError:
+            parent_job = None
+        parent_cache[parent_id] = parent_job
+    return parent_job is not None and parent_job.id in status.completed
 
 
 def ready_directories(
@@ -125,12 +166,35 @@ def ready_directories(
     action_names = [a.name for a in spec.actions]
     status = _gather_row_status(project_path, action_names)
 
+    # One walk over the project instead of a metadata scan per action.
+    jobs_by_action: dict[str, list[signac.Job]] = {}
+    for job in project:
+        jobs_by_action.setdefault(job.sp.get("action"), []).append(job)
+
+    # Translate the glob once; fnmatch.fnmatch would recompile it per action.
+    matcher = (
+        None
+        if action_pattern in (None, "*")
+        else re.compile(fnmatch.translate(action_pattern)).match
+    )
+
     ready: list[str] = []
+    parent_cache: dict[str | None, signac.Job | None] = {}
+    blocked = status.blocked
     for action in spec.topological_actions():
-        if not _matches_action(action.name, action_pattern):
+        if matcher is not None and matcher(action.name) is None:
             continue
-        for job in project.find_jobs({"action": action.name}):
-            if _job_is_ready(job, action, status):
+        jobs = jobs_by_action.get(action.name, [])
+        eligible_set = status.eligible_by_action.get(action.name)
+        if eligible_set:
+            # One set subtraction prunes blocked and ineligible ids before
+            # the per-job dependency checks.
+            candidates = eligible_set - blocked
+            jobs = [job for job in jobs if job.id in candidates]
+        else:
+            jobs = [job for job in jobs if job.id not in blocked]
+        for job in jobs:
+            if _parent_completed(job, action, status, parent_cache):
                 ready.append(job.id)
 
     return ready
@@ -153,4 +217,4 @@ def submit_directories(
     if limit is not None:
         cmd.extend(["-n", str(limit)])
     cmd.extend(list(directories))
-    _run_row(cmd, project_path)
+    _run_row(cmd, project_path, capture=False)
@@ -2,11 +2,15 @@
 
 from __future__ import annotations
 
+import functools
+import json
+import os
+import heapq
+import sys
 import tomllib
-from collections import deque
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 
 class ConfigValidationError(Exception):
@@ -29,14 +33,14 @@ class DependencySpec:
     sp_key: str = "parent_action"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ActionSpec:
     """Describes an action (stage) in the workflow."""
 
     name: str
-    sp_keys: List[str]
+    sp_keys: Tuple[str, ...]
     dependency: Optional[DependencySpec] = None
-    outputs: List[str] | None = None
+    outputs: Tuple[str, ...] | None = None
     runner: Optional[str] = None
 
     @staticmethod
@@ -63,12 +67,20 @@ class ActionSpec:
         if "name" not in data:
             raise ConfigValidationError("Each action must define a name")
 
-        name = str(data["name"])
-        sp_keys = list(map(str, data.get("sp_keys", [])))
-        outputs = data.get("outputs")
-        runner = data.get("runner")
+        get = data.get
+        # Interned names make the many per-name dict lookups (action index,
+        # indegree, children) hit CPython's pointer-equality fast path.
+        name = sys.intern(str(data["name"]))
+        # Config values are already str in practice; only coerce the odd one
+        # out instead of paying a str() call per key.
+        sp_keys = tuple(
+            key if type(key) is str else str(key) for key in get("sp_keys") or ()
+        )
+        raw_outputs = get("outputs")
+        outputs = tuple(map(str, raw_outputs)) if raw_outputs else None
+        runner = get("runner")
 
-        raw_dep = data.get("deps") or data.get("dependency")
+        raw_dep = get("deps") or get("dependency")
         dependency = None
         if raw_dep:
             if not isinstance(raw_dep, dict):
@@ -81,15 +93,11 @@ class ActionSpec:
                     "deps.action is required when specifying a dependency"
                 )
             sp_key = raw_dep.get("sp_key", "parent_action")
-            dependency = DependencySpec(action=str(dep_action), sp_key=str(sp_key))
-
-        return ActionSpec(
-            name=name,
-            sp_keys=sp_keys,
-            dependency=dependency,
-            outputs=outputs,
-            runner=runner,
-        )
+            dependency = DependencySpec(
+                action=sys.intern(str(dep_action)), sp_key=str(sp_key)
+            )
+
+        return ActionSpec(name, sp_keys, dependency, outputs, runner)
 
 
 @dataclass(frozen=True)
@@ -118,12 +126,56 @@ class WorkspaceSpec:
         return WorkspaceSpec(value_file=str(value_file))
 
 
+def _load_toml(path: Path) -> Dict[str, Any]:
+    # Binary parse: tomllib decodes internally, so read_text's file-sized
+    # intermediate str is never built.
+    with path.open("rb") as fh:
+        return tomllib.load(fh)
+
+
+# Resolved on first YAML load so repeated loads skip the import-statement
+# lookup and the CSafeLoader probe.
+_yaml_load = None
+
+
+def _load_yaml(path: Path) -> Dict[str, Any]:
+    global _yaml_load
+    if _yaml_load is None:
+        try:
+            import yaml
+        except ImportError as exc:  # pragma: no cover - optional dependency
+            raise ImportError("PyYAML is required to load YAML configs") from exc
+        # libyaml's CSafeLoader parses far faster than the pure-Python
+        # loader; feed it raw bytes so it also does the UTF-8 decode.
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        _yaml_load = functools.partial(yaml.load, Loader=loader)
+    return _yaml_load(path.read_bytes()) or {}
+
+
+# Suffix dispatch built once at import instead of re-testing set literals on
+# every load call.
+_LOADERS: Dict[str, Callable[[Path], Dict[str, Any]]] = {
+    ".toml": _load_toml,
+    ".yaml": _load_yaml,
+    ".yml": _load_yaml,
+}
+
+
 class WorkflowSpec:
     """Parsed configuration for a workflow.
 
     Provides validation, topological ordering, and access to experiments.
     """
 
+    __slots__ = (
+        "actions",
+        "_experiments",
+        "workspace",
+        "_action_index",
+        "_children",
+        "_topo_cache",
+    )
+
     def __init__(
         self,
         actions: List[ActionSpec],
@@ -131,33 +183,85 @@ class WorkflowSpec:
         workspace: WorkspaceSpec,
     ):
         self.actions = actions
-        self._experiments = experiments
+        # Stored as a tuple: the property can hand out the same object on
+        # every access instead of copying, and the outer sequence stays
+        # immutable.
+        self._experiments = tuple(experiments)
         self.workspace = workspace
-        self._action_index = {a.name: a for a in actions}
-        if len(self._action_index) != len(actions):
-            raise ConfigValidationError("Action names must be unique")
+        # One pass builds the index and catches duplicates, naming the
+        # offender instead of just comparing lengths afterwards.
+        index: Dict[str, ActionSpec] = {}
+        for a in actions:
+            if a.name in index:
+                raise ConfigValidationError(f"Duplicate action name: '{a.name}'")
+            index[a.name] = a
+        self._action_index = index
+        # Child adjacency is shared by validation, the topological sort, and
+        # downstream-cascade consumers; the graph never changes, so build it
+        # once here. Dangling parents surface during this edge scan.
+        children: Dict[str, List[str]] = {a.name: [] for a in actions}
+        for a in actions:
+            dep = a.dependency
+            if dep is not None:
+                parent = dep.action
+                if parent not in children:
+                    raise ConfigValidationError(
+                        f"Action '{a.name}' depends on undefined action '{parent}'"
+                    )
+                children[parent].append(a.name)
+        self._children = children
+        # Filled by the first topological_actions call; the action graph is
+        # immutable after construction, so one sort serves every caller.
+        self._topo_cache: Optional[List[ActionSpec]] = None
         self._validate_dependencies()
 
     @staticmethod
-    def load(path: str | Path) -> "WorkflowSpec":
-        """Load and validate a workflow spec from a TOML or YAML file."""
-        path = Path(path)
+    def _load_mapping(path: Path) -> Dict[str, Any]:
+        """Parse a TOML or YAML config file into a raw mapping."""
         if not path.exists():
             raise FileNotFoundError(path)
 
-        data: Dict[str, Any]
-        if path.suffix.lower() in {".toml"}:
-            data = tomllib.loads(path.read_text())
-        elif path.suffix.lower() in {".yaml", ".yml"}:
-            try:
-                import yaml
-            except ImportError as exc:  # pragma: no cover - optional dependency
-                raise ImportError("PyYAML is required to load YAML configs") from exc
-            data = yaml.safe_load(path.read_text()) or {}
-        else:
+        loader = _LOADERS.get(path.suffix.lower())
+        if loader is None:
             raise ConfigValidationError(f"Unsupported config extension: {path.suffix}")
 
-        return WorkflowSpec.from_mapping(data)
+        # Sidecar cache: repeated CLI invocations re-read the same config, and
+        # json's C decoder is much faster than the TOML/YAML parsers. The
+        # cache is keyed on the source mtime and is strictly best-effort.
+        mtime_ns = path.stat().st_mtime_ns
+        cache_path = path.parent / (path.name + ".cache.json")
+        try:
+            cached = json.loads(cache_path.read_bytes())
+        except (OSError, ValueError):
+            cached = None
+        # A corrupt or foreign sidecar must never break the load: require
+        # the expected shape, not just parseable JSON.
+        if isinstance(cached, dict) and cached.get("mtime_ns") == mtime_ns:
+            data = cached.get("data")
+            if isinstance(data, dict):
+                return data
+
+        data = loader(path)
+        try:
+            encoded = json.dumps({"mtime_ns": mtime_ns, "data": data})
+            # json coerces non-str keys to str (possible in YAML), which
+            # would make cached loads diverge from fresh parses — and with
+            # them, statepoints and job ids. Only cache data that survives
+            # the round-trip unchanged.
+            if json.loads(encoded)["data"] == data:
+                tmp = cache_path.with_name(cache_path.name + ".tmp")
+                tmp.write_text(encoded)
+                os.replace(tmp, cache_path)
+        except (OSError, TypeError, ValueError):
+            # Unwritable directory or values JSON cannot represent (e.g. YAML
+            # dates): skip the cache rather than fail the load.
+            pass
+        return data
+
+    @staticmethod
+    def load(path: str | Path) -> "WorkflowSpec":
+        """Load and validate a workflow spec from a TOML or YAML file."""
+        return WorkflowSpec.from_mapping(WorkflowSpec._load_mapping(Path(path)))
 
     @staticmethod
     def from_mapping(data: Dict[str, Any]) -> "WorkflowSpec":
@@ -165,7 +269,9 @@ class WorkflowSpec:
         raw_actions = data.get("actions") or data.get("action")
         if not raw_actions:
             raise ConfigValidationError("Configuration must include an 'actions' array")
-        if not isinstance(raw_actions, Iterable):
+        # Concrete sequence check: Iterable would also accept a bare string,
+        # and len-able input lets the comprehensions below presize.
+        if not isinstance(raw_actions, (list, tuple)):
             raise ConfigValidationError("'actions' must be a list of action tables")
 
         actions = [ActionSpec.from_mapping(entry) for entry in raw_actions]
@@ -173,80 +279,119 @@ class WorkflowSpec:
         workspace = WorkspaceSpec.from_mapping(data.get("workspace", {}))
 
         raw_experiments = data.get("experiments") or data.get("experiment") or []
-        if raw_experiments and not isinstance(raw_experiments, Iterable):
+        if raw_experiments and not isinstance(raw_experiments, (list, tuple)):
             raise ConfigValidationError("'experiments' must be a list")
 
         experiments: List[Dict[str, Dict[str, Any]]] = []
         for idx, exp in enumerate(raw_experiments):
             if not isinstance(exp, dict):
                 raise ConfigValidationError(f"Experiment #{idx} must be a table/object")
-            # Each key is an action name mapping to params.
-            experiments.append({k: v or {} for k, v in exp.items()})
+            # Each key is an action name mapping to params. Parsed configs
+            # already give dict values, so only rebuild when something needs
+            # normalizing to {}.
+            if all(type(v) is dict for v in exp.values()):
+                experiments.append(exp)
+            else:
+                experiments.append({k: v or {} for k, v in exp.items()})
 
         return WorkflowSpec(
             actions=actions, experiments=experiments, workspace=workspace
         )
 
     def _validate_dependencies(self) -> None:
-        action_names = {a.name for a in self.actions}
-        for action in self.actions:
-            if action.dependency and action.dependency.action not in action_names:
-                raise ConfigValidationError(
-                    f"Action '{action.name}' depends on undefined action '{action.dependency.action}'"
-                )
-        # Check cycles via topological sort attempt
+        # Dangling parents were caught while building the adjacency in
+        # __init__; the sort attempt covers the remaining cycle check.
         self.topological_actions()
 
     def topological_actions(self) -> List[ActionSpec]:
         """Return actions ordered so parents come before children.
 
+        Among actions whose parents are all satisfied, those with the most
+        direct dependents come first, so downstream consumers (submission,
+        materialization) unblock the widest subtrees earliest.
+
         Raises
         ------
         ConfigValidationError
             If the dependency graph contains a cycle.
         """
-        indegree = {a.name: 0 for a in self.actions}
-        children: Dict[str, List[str]] = {a.name: [] for a in self.actions}
-
-        for action in self.actions:
-            if action.dependency:
-                parent = action.dependency.action
-                indegree[action.name] += 1
-                children[parent].append(action.name)
-
-        queue = deque(name for name, deg in indegree.items() if deg == 0)
+        if self._topo_cache is not None:
+            return list(self._topo_cache)
+
+        children = self._children
+        indegree = dict.fromkeys(children, 0)
+        for kids in children.values():
+            for child in kids:
+                indegree[child] += 1
+
+        heap = [
+            (-len(children[name]), name)
+            for name, deg in indegree.items()
+            if deg == 0
+        ]
+        heapq.heapify(heap)
 
         ordered: List[str] = []
 
-        while queue:
-            current = queue.popleft()
+        while heap:
+            _, current = heapq.heappop(heap)
             ordered.append(current)
 
             for child in children[current]:
                 indegree[child] -= 1
                 if indegree[child] == 0:
-                    queue.append(child)
+                    heapq.heappush(heap, (-len(children[child]), child))
 
         if len(ordered) != len(indegree):
             raise ConfigValidationError("Action graph contains a cycle")
 
-        return [self._action_index[name] for name in ordered]
+        self._topo_cache = [self._action_index[name] for name in ordered]
+        return list(self._topo_cache)
+
+    @property
+    def action_by_name(self) -> Dict[str, ActionSpec]:
+        """Mapping of action name to spec, built once at construction."""
+
+        return self._action_index
 
     @property
-    def experiments(self) -> List[Dict[str, Dict[str, Any]]]:
-        """List of experiment parameter blocks copied from the config."""
+    def action_children(self) -> Dict[str, List[str]]:
+        """Child action names per action, built once at construction."""
 
-        return list(self._experiments)
+        return self._children
+
+    @property
+    def experiments(self) -> tuple[Dict[str, Dict[str, Any]], ...]:
+        """Experiment parameter blocks from the config (immutable sequence)."""
+
+        return self._experiments
 
     def get_action(self, name: str) -> ActionSpec:
         """Return an action by name or raise :class:`ConfigValidationError`."""
-        try:
-            return self._action_index[name]
-        except KeyError as exc:
-            raise ConfigValidationError(f"Unknown action '{name}'") from exc
+        # dict.get avoids try/except frame setup on the hot (found) path.
+        action = self._action_index.get(name)
+        if action is None:
+            raise ConfigValidationError(f"Unknown action '{name}'")
+        return action
 
 
 def load_spec(path: str | Path) -> WorkflowSpec:
     """Load and validate a workflow spec from disk (TOML or YAML)."""
 
     return WorkflowSpec.load(path)
+
+
+def load_spec_with_raw(path: str | Path) -> tuple[WorkflowSpec, Dict[str, Any]]:
+    """Load a workflow spec plus the raw mapping it was parsed from.
+
+    Useful for callers that also need to edit the config file, so they can
+    reuse the parse instead of reading it a second time.
+
+    The spec's experiment blocks alias dicts inside the returned mapping
+    (``from_mapping`` reuses already-normalized blocks rather than copying
+    them), so edits to the mapping write through to ``spec.experiments``.
+    Only mutate the mapping once you are done reading the spec.
+    """
+
+    data = WorkflowSpec._load_mapping(Path(path))
+    return WorkflowSpec.from_mapping(data), data
@@ -0,0 +1,33 @@
+"""Shared pytest fixtures."""
+
+import os
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+
+def _tmpfs_base() -> Path | None:
+    """Return a writable tmpfs directory to host test workspaces, if any."""
+
+    if sys.platform != "linux":
+        return None
+    base = Path(os.environ.get("GRUBICY_TEST_TMPFS", "/dev/shm"))
+    if base.is_dir() and os.access(base, os.W_OK):
+        return base
+    return None
+
+
+@pytest.fixture
+def tmp_path(tmp_path_factory, request):
+    # signac workspaces are many small JSON files; hosting them on tmpfs
+    # keeps the write traffic in RAM. Falls back to the stock tmp_path
+    # behaviour when no tmpfs is available.
+    base = _tmpfs_base()
+    if base is None:
+        return tmp_path_factory.mktemp(request.node.name[:30] or "t")
+    path = Path(tempfile.mkdtemp(prefix="grubicy-", dir=base))
+    request.addfinalizer(lambda: shutil.rmtree(path, ignore_errors=True))
+    return path
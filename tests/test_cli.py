@@ -1,3 +1,4 @@
+import csv
 import json
 from pathlib import Path
 
@@ -116,6 +117,40 @@ def test_cli_collect_params(tmp_path, monkeypatch):
     )
 
 
+def test_cli_collect_params_csv_alignment(tmp_path, capsys, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    config = _write_config(tmp_path)
+    project = signac.init_project("cli-project")
+    main(["materialize", str(config), "--project", str(project.path)])
+
+    s1 = next(iter(project.find_jobs({"action": "s1"})))
+    s1.doc["result"] = 4
+    capsys.readouterr()  # drop the materialize summary
+
+    main(
+        [
+            "collect-params",
+            str(config),
+            "s2",
+            "--project",
+            str(project.path),
+            "--include-doc",
+            "--format",
+            "csv",
+        ]
+    )
+
+    header, *data_rows = csv.reader(capsys.readouterr().out.splitlines())
+
+    assert set(header) == {"s1.p1", "s2.p2", "s1.doc.result"}
+    assert len(data_rows) == 1
+    assert all(len(row) == len(header) for row in data_rows)
+    row = dict(zip(header, data_rows[0]))
+    assert row["s1.p1"] == "1"
+    assert row["s2.p2"] == "2"
+    assert row["s1.doc.result"] == "4"
+
+
 def test_cli_migrate_plan_updates_config(tmp_path, monkeypatch):
     monkeypatch.chdir(tmp_path)
     config = _write_config(tmp_path)
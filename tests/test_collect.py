@@ -1,7 +1,7 @@
 import pytest
 import signac
 
-from grubicy.collect import collect_params_with_parents
+from grubicy.collect import collect_params_with_parents, collect_table
 from grubicy.materialize import materialize
 from grubicy.spec import WorkflowSpec
 
@@ -73,3 +73,37 @@ def test_collect_missing_ok_skips_missing_parents(tmp_path, monkeypatch):
     )
 
     assert rows == []
+
+
+def test_collect_table_matches_rows_with_late_doc_column(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    project = signac.init_project("collect-project")
+    spec = WorkflowSpec.from_mapping(
+        {
+            "actions": [
+                {"name": "s1", "sp_keys": ["p1"]},
+                {"name": "s2", "sp_keys": ["p2"], "deps": {"action": "s1"}},
+            ],
+            "experiments": [
+                {"s1": {"p1": 1}, "s2": {"p2": 2}},
+                {"s1": {"p1": 1}, "s2": {"p2": 3}},
+            ],
+        }
+    )
+    materialize(spec, project, spec.experiments)
+
+    # Only one leaf carries the doc key, so its column is absent for the
+    # other row and the table has to backfill or pad with None.
+    leaf = next(iter(project.find_jobs({"action": "s2", "p2": 3})))
+    leaf.doc["metric"] = 9
+
+    rows = collect_params_with_parents(spec, project, "s2", include_doc=True)
+    table = collect_table(spec, project, "s2", include_doc=True)
+
+    assert table.count == len(rows) == 2
+    assert all(len(values) == table.count for values in table.columns.values())
+    assert list(table.iter_rows()) == [row.data for row in rows]
+
+    metric = table.columns["s2.doc.metric"]
+    assert metric.count(None) == 1
+    assert 9 in metric
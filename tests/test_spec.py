@@ -1,3 +1,5 @@
+import json
+
 import pytest
 
 from grubicy.spec import ConfigValidationError, WorkflowSpec
@@ -34,3 +36,62 @@ def test_cycle_detection_raises():
                 ]
             }
         )
+
+
+def _write_config(path):
+    path.write_text('[[actions]]\nname = "s1"\nsp_keys = ["p"]\n', encoding="utf-8")
+
+
+def test_sidecar_cache_hit_skips_reparse(tmp_path):
+    config = tmp_path / "pipeline.toml"
+    _write_config(config)
+    WorkflowSpec._load_mapping(config)
+
+    # Tamper with the cached data while the source mtime is unchanged; a
+    # cache hit must return the cached mapping without re-parsing.
+    cache = tmp_path / "pipeline.toml.cache.json"
+    cached = json.loads(cache.read_text())
+    cached["data"]["actions"][0]["name"] = "from-cache"
+    cache.write_text(json.dumps(cached))
+
+    data = WorkflowSpec._load_mapping(config)
+
+    assert data["actions"][0]["name"] == "from-cache"
+
+
+def test_sidecar_cache_stale_mtime_reparses(tmp_path):
+    config = tmp_path / "pipeline.toml"
+    _write_config(config)
+    WorkflowSpec._load_mapping(config)
+
+    cache = tmp_path / "pipeline.toml.cache.json"
+    cached = json.loads(cache.read_text())
+    cached["data"]["actions"][0]["name"] = "from-cache"
+    cached["mtime_ns"] -= 1
+    cache.write_text(json.dumps(cached))
+
+    data = WorkflowSpec._load_mapping(config)
+
+    assert data["actions"][0]["name"] == "s1"
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        "not json",
+        "null",
+        '["mtime_ns"]',
+        '{"mtime_ns": {mtime_ns}}',
+        '{"mtime_ns": {mtime_ns}, "data": null}',
+    ],
+)
+def test_sidecar_cache_corrupt_falls_back(tmp_path, payload):
+    config = tmp_path / "pipeline.toml"
+    _write_config(config)
+
+    cache = tmp_path / "pipeline.toml.cache.json"
+    cache.write_text(payload.replace("{mtime_ns}", str(config.stat().st_mtime_ns)))
+
+    data = WorkflowSpec._load_mapping(config)
+
+    assert data["actions"][0]["name"] == "s1"
@@ -1,3 +1,4 @@
+import io
 import subprocess
 import sys
 import pytest
@@ -11,16 +12,33 @@ from grubicy.row_utils import (
 from grubicy.spec import WorkflowSpec
 
 
+def _fake_popen(calls, stdout, stderr, returncode):
+    class FakePopen:
+        def __init__(self, cmd, cwd, **kwargs):
+            calls.append((cmd, cwd))
+            self.stdout = io.StringIO(stdout)
+            self.stderr = io.StringIO(stderr)
+            self.returncode = returncode
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            self.stdout.close()
+            self.stderr.close()
+            return False
+
+    return FakePopen
+
+
 def test_list_status_parses_output(monkeypatch, tmp_path):
     calls = []
 
-    def fake_run(cmd, cwd, capture_output, text, check):
-        calls.append((cmd, cwd))
-        return subprocess.CompletedProcess(
-            cmd, 0, stdout="a\n\nb\nNo matches.\n", stderr=""
-        )
-
-    monkeypatch.setattr(subprocess, "run", fake_run)
+    monkeypatch.setattr(
+        subprocess,
+        "Popen",
+        _fake_popen(calls, stdout="a\n\nb\nNo matches.\n", stderr="", returncode=0),
+    )
 
     result = _list_directories_with_status(tmp_path, "--completed", action="s2")
 
@@ -38,10 +56,11 @@ def test_list_status_parses_output(monkeypatch, tmp_path):
 
 
 def test_list_status_raises_on_error(monkeypatch, tmp_path):
-    def fake_run(cmd, cwd, capture_output, text, check):
-        return subprocess.CompletedProcess(cmd, 1, stdout="", stderr="Action missing")
-
-    monkeypatch.setattr(subprocess, "run", fake_run)
+    monkeypatch.setattr(
+        subprocess,
+        "Popen",
+        _fake_popen([], stdout="", stderr="Action missing", returncode=1),
+    )
 
     with pytest.raises(RowCLIError):
         _list_directories_with_status(tmp_path, "--completed", action="s2")
@@ -50,7 +69,7 @@ def test_list_status_raises_on_error(monkeypatch, tmp_path):
 def test_submit_directories_builds_command(monkeypatch, tmp_path):
     seen = []
 
-    def fake_run(cmd, cwd, capture_output, text, check):
+    def fake_run(cmd, cwd, stdout, stderr, text, check):
         seen.append((cmd, cwd))
         return subprocess.CompletedProcess(cmd, 0, stdout="", stderr="")
 
@@ -120,6 +139,10 @@ def test_ready_directories(monkeypatch, tmp_path):
                 Job(self, "c2", {"action": "s2", "parent_action": "p2"}),
             ]
 
+        def __iter__(self):
+            yield from self.find_jobs({"action": "s1"})
+            yield from self.find_jobs({"action": "s2"})
+
         def open_job(self, id):
             return next(j for j in self.find_jobs({"action": "s1"}) if j.id == id)
 
@@ -165,6 +188,9 @@ def test_ready_directories_respects_eligible(monkeypatch, tmp_path):
         def find_jobs(self, query):
             return [Job("allow", {"action": "s1"}), Job("block", {"action": "s1"})]
 
+        def __iter__(self):
+            return iter(self.find_jobs({"action": "s1"}))
+
     project = FakeProject()
 
     ready = ready_directories(spec, project)